@@ -1,12 +1,16 @@
 import random
 import operator
-import collections
-import functools
+import heapq
+import contextlib
+import concurrent.futures
 import itertools
 import math
 import dataclasses
 import typing
 
+from .node import Node
+from .edge import Edge
+
 
 
 def biased_randomisation (array, beta=0.3):
@@ -18,15 +22,192 @@ def biased_randomisation (array, beta=0.3):
 
     and it therefore prioritise the first elements in list.
 
+    The options are kept from the worst to the best, so that picking
+    the i-th best element only shifts the i elements after it, which are
+    very few given the distribution.
+
     :param array: The set of options already sorted from the best to the worst.
     :param beta: The parameter of the quasi-geometric distribution.
     :return: The element picked at each iteration.
     """
-    L = len(array)
     options = list(array)
-    for _ in range(L):
-        idx = int(math.log(random.random(), 1.0 - beta)) % len(options)
-        yield options.pop(idx)
+    options.reverse()
+    inv_log = 1.0 / math.log(1.0 - beta)
+    for L in range(len(options), 0, -1):
+        idx = int(math.log(random.random()) * inv_log) % L
+        yield options.pop(-1 - idx)
+
+
+
+def _find (parent, node):
+    """
+    This method finds the route of a node in the union-find structure
+    of the kernel, compressing the path walked so far (path halving).
+
+    :param parent: The parent of each node in the union-find structure.
+    :param node: The index of the node.
+    :return: The id of the route, i.e. the root of the node.
+    """
+    while parent[node] != node:
+        parent[node] = node = parent[parent[node]]
+    return node
+
+
+
+def _merge (order, edge_origin, edge_dest, edge_cost, inverse_cost,
+            dn_cost, nd_cost, reverse, maxcost, minroutes):
+    """
+    This method is the kernel of the Clarke & Wright Savings heuristic.
+    It works on plain lists of numbers indexed by node and edge, so that
+    no attribute of nodes, edges and routes is accessed while merging.
+
+    The nodes of a route are grouped in a union-find structure whose root
+    identifies the route (see _find), and they are linked to each other
+    with no direction: each node only knows its neighbours and the edges
+    going to them. The direction of a route is given by its head and tail,
+    so reversing a route is just a swap of them (and of its costs in the
+    two directions), and merging two routes is just a link between them.
+
+    :param order: The indexes of the edges in the order they are considered.
+    :param edge_origin, edge_dest: The indexes of the nodes connected by each edge.
+    :param edge_cost: The cost of each edge.
+    :param inverse_cost: The cost of the inverse of each edge.
+    :param dn_cost, nd_cost: The cost of depot-to-node and node-to-depot edges.
+    :param reverse: If True the reversion of the routes is considered.
+    :param maxcost: The maximum cost of a route.
+    :param minroutes: The minimum number of routes allowed.
+    :return: The first node of each route (-1 for the routes merged into
+            others), the links of each node as (neighbour, edge) pairs,
+            the cost of each route, and the overall cost of the solution.
+            Negative edges in the links stand for the inverse of the
+            edge ~idx.
+    """
+    n = len(dn_cost)
+    links, degree = [[] for _ in range(n)], [0] * n
+    parent, size = list(range(n)), [1] * n
+    head, tail = list(range(n)), list(range(n))
+    route_cost = [dn_cost[i] + nd_cost[i] for i in range(n)]
+    route_rcost = list(route_cost)
+    total_cost, nroutes = sum(route_cost), n
+
+    for e in order:
+
+        # Check if the minimum number of routes has been reached
+        if nroutes <= minroutes:
+            break
+
+        # Check if extremes of edge are internal, i.e., they are already
+        # linked on both sides. In this case, next edge is considered.
+        i, j = edge_origin[e], edge_dest[e]
+        if degree[i] == 2 or degree[j] == 2:
+            continue
+
+        # Get the routes connected by the currently considered edge
+        iroute, jroute = parent[i], parent[j]
+        if parent[iroute] != iroute:
+            iroute = _find(parent, iroute)
+        if parent[jroute] != jroute:
+            jroute = _find(parent, jroute)
+
+        # If the routes are the same, next edge is considered
+        if iroute == jroute:
+            continue
+
+        first, second, link = iroute, jroute, e
+        icost, jcost = route_cost[iroute], route_cost[jroute]
+        reversing = -1
+
+        # If the merging is not possible with no reversions...
+        if i != tail[iroute] or j != head[jroute]:
+            if not reverse:
+                continue
+            # If both routes should be reversed, the inverse edge merges
+            # the second route to the first one.
+            if i == head[iroute] and j == tail[jroute]:
+                first, second, link = jroute, iroute, ~e
+            # Reverse the first route
+            elif i != tail[iroute]:
+                reversing, icost = iroute, route_rcost[iroute]
+            # Reverse the second route
+            else:
+                reversing, jcost = jroute, route_rcost[jroute]
+
+        # The link replaces the edges to the depot between the two routes,
+        # i.e., from the last node of the first route and to the first node
+        # of the second one. The saving of the edge is not used here, since
+        # it is not necessarily equal to the cost removed (e.g., with
+        # parametric savings).
+        if link >= 0:
+            delta = edge_cost[e] - nd_cost[i] - dn_cost[j]
+        else:
+            delta = inverse_cost[e] - nd_cost[j] - dn_cost[i]
+
+        # If the maxcost of a route is exceeded next edge is considered
+        if icost + jcost + delta > maxcost:
+            continue
+
+        if reversing != -1:
+            head[reversing], tail[reversing] = tail[reversing], head[reversing]
+            route_cost[reversing], route_rcost[reversing] = route_rcost[reversing], route_cost[reversing]
+            total_cost += route_cost[reversing] - route_rcost[reversing]
+
+        # Link the last node of the first route to the first node of the
+        # second one, and remove the edges to the depot in between.
+        ftail, shead = tail[first], head[second]
+        links[ftail].append((shead, link))
+        links[shead].append((ftail, ~link))
+        degree[ftail] += 1
+        degree[shead] += 1
+
+        # Attach the smaller route to the larger one, which keeps the data
+        # of the merged route.
+        root, child = (first, second) if size[first] >= size[second] else (second, first)
+        parent[child] = root
+        size[root] += size[child]
+        head[root], tail[root] = head[first], tail[second]
+        route_cost[root] = route_cost[first] + route_cost[second] + delta
+        total_cost += delta
+        # The cost in the opposite direction is only needed to reverse it
+        if reverse:
+            fcost, scost = route_rcost[first], route_rcost[second]
+            rcost = inverse_cost[link] if link >= 0 else edge_cost[~link]
+            route_rcost[root] = fcost + scost - dn_cost[ftail] - nd_cost[shead] + rcost
+        nroutes -= 1
+
+    return [head[r] if parent[r] == r else -1 for r in range(n)], links, route_cost, total_cost
+
+
+
+_worker_state = None
+
+
+def _init_worker (savings_order, biasedfunc, args):
+    """
+    This method initialises a process of the pool used by a parallel
+    metaheuristic, storing what all its executions have in common.
+
+    :param savings_order: The savings list.
+    :param biasedfunc: The function used for the biased randomisation
+                        (None if not required).
+    :param args: The other arguments of the kernel (see _merge).
+    """
+    global _worker_state
+    _worker_state = (savings_order, biasedfunc, args)
+
+
+
+def _run_worker (seed):
+    """
+    This method executes the kernel in a process of the pool used by
+    a parallel metaheuristic.
+
+    :param seed: The seed of the random numbers used by this execution.
+    :return: The results of the kernel (see _merge).
+    """
+    savings_order, biasedfunc, args = _worker_state
+    random.seed(seed)
+    savings_iterator = savings_order if biasedfunc is None else biasedfunc(savings_order)
+    return _merge(savings_iterator, *args)
 
 
 
@@ -35,15 +216,19 @@ class Route (object):
     An instance of this class represents a route made by a sequence
     of edges.
     """
-    def __init__ (self, edges = None):
+    __slots__ = ("edges", "cost")
+
+    def __init__ (self, edges = None, cost = None):
         """
         Initialise.
 
         :param edges: The edges that currently constitute the route.
+        :param cost: The overall cost of the route, if already known.
+                    If None, it is computed from the edges.
         :attr cost: The overall cost of the route.
         """
-        self.edges = edges or collections.deque()
-        self.cost = sum(edge.cost for edge in self.edges)
+        self.edges = edges or []
+        self.cost = cost if cost is not None else sum(edge.cost for edge in self.edges)
 
     @property
     def first_node (self):
@@ -64,8 +249,10 @@ class Route (object):
         """
         This method removes the first edge from the route and takes care
         of updating the overall cost too.
+        Since the edges are kept in a list, it is linear in the length
+        of the route, but it is never used by the algorithm.
         """
-        removed = self.edges.popleft()
+        removed = self.edges.pop(0)
         self.cost -= removed.cost
 
     def popright (self):
@@ -112,7 +299,11 @@ class CWSConfiguration:
                     In case of active biased randomisation the callable method
                     passed as biasedfunc is used.
     :param biasedfunc: The function to use in case of biased randomisation
-                        required.
+                        required. It receives the savings list as the indexes
+                        of the edges (i.e., their position in the edges passed
+                        to the algorithm) sorted for decreasing saving, not
+                        as the edges themselves, and it yields the same indexes
+                        in the order they are considered.
     :param reverse: If True every time a merging is tried, the possibility
                     to reverse the routes we are going to merge is considered.
                     Usually this parameter is False when the reverse of an edge
@@ -127,6 +318,15 @@ class CWSConfiguration:
     :param maxnoimp: The maximum number of
     :param maxcost: The maximum cost of a route that makes it feasible.
     :param minroutes: The minimum number of routes allowed.
+    :param neighbours: If not None, only the neighbours edges with lowest
+                        cost of each node (i.e., the edges to its nearest
+                        nodes) are considered in the savings list, while
+                        the others are pruned. It must be at
+                        least 1, otherwise all the edges would be pruned.
+    :param workers: The number of processes used by the metaheuristic to
+                    explore new solutions in parallel (at least 1). Only
+                    the random module is seeded again in each process, so
+                    the biasedfunc must draw its random numbers from it.
     """
     biased : bool = True
     biasedfunc : typing.Callable = biased_randomisation
@@ -137,6 +337,14 @@ class CWSConfiguration:
     maxnoimp : int = 500
     maxcost : float = float('inf')
     minroutes : float = float('-inf')
+    neighbours : int = None
+    workers : int = 1
+
+    def __post_init__ (self):
+        if self.neighbours is not None and self.neighbours < 1:
+            raise ValueError(f"neighbours must be None or at least 1, got {self.neighbours}")
+        if self.workers < 1:
+            raise ValueError(f"workers must be at least 1, got {self.workers}")
 
 
 
@@ -151,9 +359,58 @@ class ClarkeWrightSavings (object):
 
         :param nodes: The nodes to visit.
         :param edges: The edges connecting the nodes.
+
+        Nodes and edges are also described once by lists of numbers
+        indexed by their position, which are used by the kernel of the
+        heuristic (see _merge).
         """
         self.nodes = nodes
         self.edges = edges
+        index = {id(node): i for i, node in enumerate(nodes)}
+        self._origin = tuple(index[id(edge.origin)] for edge in edges)
+        self._dest = tuple(index[id(edge.dest)] for edge in edges)
+        self._saving = tuple(edge.saving for edge in edges)
+        self._cost = tuple(edge.cost for edge in edges)
+        # An edge with no inverse assigned is symmetric (see Edge.inverse),
+        # so its inverse is not created just to read its cost. Edges that
+        # do not inherit from Edge have no has_inverse, and their inverse
+        # may be None when the routes are never reversed.
+        inverses = (edge.inverse if getattr(edge, "has_inverse", True) else None for edge in edges)
+        self._inverse_cost = tuple((edge if inverse is None else inverse).cost
+                                   for edge, inverse in zip(edges, inverses))
+        self._dn_cost = tuple(node.dn_edge.cost for node in nodes)
+        self._nd_cost = tuple(node.nd_edge.cost for node in nodes)
+        self._orders = {}
+
+    @classmethod
+    def build_from_coords (cls, coords, depot=(0, 0)):
+        """
+        This method instantiates the algorithm for a classic problem where
+        the nodes are points in the plane and the cost of an edge is the
+        euclidean distance between its extremes.
+
+        Distances from the depot are computed once per node, and each
+        pair of nodes is connected by a single symmetric edge, whose
+        inverse is only created if needed (see Edge.inverse), with
+        saving s(i, j) = d(i, 0) + d(0, j) - d(i, j).
+
+        :param coords: The coordinates of the nodes. The id of each node
+                        is its position in coords.
+        :param depot: The coordinates of the depot.
+        """
+        nodes = []
+        for i, point in enumerate(coords):
+            node = Node(i, None, None)
+            d0 = math.dist(depot, point)
+            node.dn_edge, node.nd_edge = Edge("depot", node, 0, d0), Edge(node, "depot", 0, d0)
+            node.dn_edge.inverse, node.nd_edge.inverse = node.nd_edge, node.dn_edge
+            nodes.append(node)
+        edges = []
+        for (i, ipoint), (j, jpoint) in itertools.combinations(zip(nodes, coords), 2):
+            d = math.dist(ipoint, jpoint)
+            saving = i.nd_edge.cost + j.dn_edge.cost - d
+            edges.append(Edge(i, j, saving, d))
+        return cls(nodes, edges)
 
     @staticmethod
     def savings_list (edges):
@@ -165,15 +422,59 @@ class ClarkeWrightSavings (object):
         """
         return sorted(edges, key=operator.attrgetter("saving"), reverse=True)
 
-    @staticmethod
-    def _reversed (route):
+    def _savings_order (self, neighbours=None):
         """
-        This method is used to reverse a route.
-        It instantiate and return a new Route.
+        This method generates the savings list as a tuple of indexes
+        of the edges sorted for decreasing saving value.
+        The sort is stable, so the order is the same of savings_list.
+        The savings list is generated once for each value of neighbours,
+        and then reused by the following executions.
+
+        :param neighbours: If not None, only the edges that are among
+                            the neighbours edges with lowest cost of
+                            their origin or destination are kept.
+        """
+        order = self._orders.get(neighbours)
+        if order is None:
+            saving, cost = self._saving, self._cost
+            candidates = range(len(saving))
+            if neighbours is not None:
+                incident = [[] for _ in self.nodes]
+                for e, (i, j) in enumerate(zip(self._origin, self._dest)):
+                    incident[i].append(e)
+                    incident[j].append(e)
+                candidates = sorted(set(itertools.chain.from_iterable(
+                    heapq.nsmallest(neighbours, edges, key=cost.__getitem__) for edges in incident)))
+            order = self._orders[neighbours] = tuple(sorted(candidates, key=saving.__getitem__, reverse=True))
+        return order
+
+    def _route (self, head, links, cost):
+        """
+        This method builds the Route starting from a certain node
+        of a route of the kernel (see _merge), and updates the
+        reference to the route in its nodes.
 
-        :param route: The route to reverse.
+        :param head: The index of the first node of the route.
+        :param links: The (neighbour, edge) pairs of each node.
+        :param cost: The cost of the route computed by the kernel.
         """
-        return Route(collections.deque(reversed([e.inverse for e in route.edges])))
+        nodes, edges = self.nodes, self.edges
+        route_edges, members = [nodes[head].dn_edge], [head]
+        previous, node = -1, head
+        while True:
+            for neighbour, e in links[node]:
+                if neighbour != previous:
+                    route_edges.append(edges[e] if e >= 0 else edges[~e].inverse)
+                    members.append(neighbour)
+                    previous, node = node, neighbour
+                    break
+            else:
+                break
+        route_edges.append(nodes[node].nd_edge)
+        route = Route(route_edges, cost)
+        for node in members:
+            nodes[node].route = route
+        return route
 
     def heuristic (self, config):
         """
@@ -187,102 +488,87 @@ class ClarkeWrightSavings (object):
         :param config: The configuration used during the execution of the heuristic
                         (see CWSConfiguration class).
         """
-        edges, nodes = self.edges, self.nodes
-        biased, biasedfunc, reverse = config.biased, config.biasedfunc, config.reverse
-        maxcost, minroutes = config.maxcost, config.minroutes
-        routes = list()
+        return self._heuristic_from_sorted(self._savings_order(config.neighbours), config)
 
-        # Generates the dummy solution
-        for node in nodes:
-            r = Route(collections.deque([node.dn_edge, node.nd_edge]))
-            node.route = r
-            routes.append(r)
+    def _kernel_args (self, config):
+        """
+        This method returns the arguments of the kernel (see _merge) that
+        follow the savings list, i.e., the lists describing nodes and edges
+        and the parameters of the configuration as plain values.
 
-        # Generates the savings list with eventual biased randomisation
-        savings_list = self.savings_list(edges)
-        savings_iterator = savings_list if not biased else biasedfunc(savings_list)
+        :param config: The configuration used during the execution of the heuristic
+                        (see CWSConfiguration class).
+        """
+        # The kernel compares minroutes with the integer number of routes,
+        # so it is passed as an integer too (e.g., -inf becomes -1)
+        minroutes = math.floor(max(-1, min(config.minroutes, len(self.nodes))))
+        return (self._origin, self._dest, self._cost, self._inverse_cost, self._dn_cost, self._nd_cost,
+                bool(config.reverse), float(config.maxcost), minroutes)
 
-        # Starts the iterative merging process...
-        for edge in savings_iterator:
+    def _solution (self, heads, links, route_cost):
+        """
+        This method builds the routes of a solution found by the kernel
+        (see _merge).
 
-            # Check if the minimum number of routes has been reached
-            if len(routes) <= minroutes:
-                return routes, sum(r.cost for r in routes)
+        :param heads: The first node of each route.
+        :param links: The (neighbour, edge) pairs of each node.
+        :param route_cost: The cost of each route.
+        """
+        return [self._route(head, links, route_cost[r]) for r, head in enumerate(heads) if head != -1]
 
-            # Get the routes connected by the currently considered edge
-            origin, dest = edge.origin, edge.dest
-            iroute, jroute = edge.origin.route, edge.dest.route
+    def _heuristic_from_sorted (self, savings_order, config):
+        """
+        This method executes the heuristic on a savings list that has been
+        already sorted, so that it can be generated once and reused by
+        many executions.
 
-            # If the routes are the same, next edge is considered
-            if iroute == jroute:
-                continue
+        :param savings_order: The savings list (see _savings_order).
+        :param config: The configuration used during the execution of the heuristic
+                        (see CWSConfiguration class).
+        """
+        biased, biasedfunc = config.biased, config.biasedfunc
 
-            # Check if extremes of edge are internal. In this case,
-            # next edge is considered.
-            if (origin != iroute.first_node and origin != iroute.last_node) or \
-                (dest != jroute.first_node and dest != jroute.last_node):
-                continue
+        # Applies the eventual biased randomisation to the savings list
+        savings_iterator = savings_order if not biased else biasedfunc(savings_order)
 
-            # If the merging is possible with no reversions...
-            if origin == iroute.last_node and dest == jroute.first_node:
-                # If the maxcost of a route is not exceeded...
-                if iroute.cost + jroute.cost - edge.saving <= maxcost:
-                    # Remove the edges to the origin in the merged routes
-                    iroute.popright(); jroute.popleft()
-                    # Build the new route
-                    iroute.append(edge)
-                    iroute.extend(jroute.edges)
-                    # Update the reference to the route in the nodes
-                    edge.dest.route = iroute
-                    for e in itertools.islice(jroute.edges, 0, len(jroute.edges) - 1):
-                        e.dest.route = iroute
-                    # Update the list of routes
-                    routes.remove(jroute)
-                # Next edge is considered
-                continue
-            
-            # Control not needed?
-            # If it is not possible to reverse the routes and the edge
-            #if not reverse and (origin != iroute.last_node or dest != jroute.first_node):
-            #    continue
-
-            # If the reversion of routes is possible
-            if reverse:
-                # Initialise the reversed edge and routes before eventual
-                # reversing process.
-                redge, riroute, rjroute = edge, iroute, jroute
-
-                # If both routes should be reversed, reverse the edge
-                if origin == iroute.first_node and dest == jroute.last_node:
-                    redge = edge.inverse
-                # Reverse the first route
-                elif origin != iroute.last_node and dest == jroute.first_node:
-                    routes.remove(iroute)
-                    riroute = self._reversed(iroute)
-                    routes.append(riroute)
-                # Reverse the second route
-                elif origin == iroute.last_node and dest != jroute.first_node:
-                    routes.remove(jroute)
-                    rjroute = self._reversed(jroute)
-                    routes.append(rjroute)
-
-                # Once routes and edge are ready for merging, check the cost
-                # If the cost of the new route does not exceed the maximum allowed...
-                if riroute.cost + rjroute.cost - redge.saving <= maxcost:
-                    # Remove the edges to the origin in the merged routes
-                    riroute.popright(); rjroute.popleft()
-                    # Build the new route
-                    riroute.append(redge)
-                    riroute.extend(rjroute.edges)
-                    # Update the reference to the route in the nodes
-                    for e in itertools.islice(riroute.edges, 0, len(riroute.edges) - 1):
-                        e.dest.route = riroute
-                    # Update the list of routes
-                    routes.remove(rjroute)
+        # Starts the iterative merging process...
+        heads, links, route_cost, cost = _merge(savings_iterator, *self._kernel_args(config))
 
         # Returns the solution found
-        return routes, sum(r.cost for r in routes)
+        return self._solution(heads, links, route_cost), cost
 
+    def _kernel_runs (self, savings_order, config):
+        """
+        This method generates the results of the kernel (see _merge) for
+        the maxiter executions of the heuristic made by the metaheuristic.
+
+        If more than one worker is required, the executions are distributed
+        on a pool of processes in small batches, so that a few of them are
+        wasted when the metaheuristic stops before maxiter. Each execution
+        gets its own random seed drawn from the random module, so the
+        biasedfunc must be a function that can be pickled, and it must
+        draw its random numbers from the random module too (any other
+        generator would have the same state in all the processes).
+
+        :param savings_order: The savings list (see _savings_order).
+        :param config: The configurations of parameters defined.
+        """
+        biasedfunc = config.biasedfunc if config.biased else None
+        args = self._kernel_args(config)
+        maxiter, workers = config.maxiter, config.workers
+
+        if workers <= 1:
+            for _ in range(maxiter):
+                savings_iterator = savings_order if biasedfunc is None else biasedfunc(savings_order)
+                yield _merge(savings_iterator, *args)
+            return
+
+        batch = 4 * workers
+        with concurrent.futures.ProcessPoolExecutor(workers, initializer=_init_worker,
+                                                    initargs=(savings_order, biasedfunc, args)) as pool:
+            for done in range(0, maxiter, batch):
+                seeds = [random.getrandbits(64) for _ in range(min(batch, maxiter - done))]
+                yield from pool.map(_run_worker, seeds)
 
     def _metaheuristic (self, starting_sol, config):
         """
@@ -292,28 +578,29 @@ class ClarkeWrightSavings (object):
         the biased randomisation in the configuration should be activated
         and a biasedfunc should be provided.
 
+        The savings list is sorted only once, and the routes of a new
+        solution are built only when it improves the best one.
+
         :param starting_sol: The starting solution.
         :param config: The configurations of parameters defined.
         """
-        # Initialise the behaviour we want to use to generate new solutions
-        heuristic = functools.partial(self.heuristic, config)
         # Initialise the current best solution
         best, cost = starting_sol
-        maxiter, maxnoimp = config.maxiter, config.maxnoimp
+        maxnoimp = config.maxnoimp
         missed_improvements = 0
         # Starts the iterated local search
-        for _ in range(maxiter):
-            # Generates a new solution
-            newsol, newcost = heuristic()
-            missed_improvements += 1
-            # Eventually updates the best
-            if newcost < cost:
-                best, cost = newsol, newcost
-                missed_improvements = 0
-            # If the maximum number of iterations with no improvement is exceeded
-            # returns the current best
-            if missed_improvements > maxnoimp:
-                return best, cost
+        savings_order = self._savings_order(config.neighbours)
+        with contextlib.closing(self._kernel_runs(savings_order, config)) as runs:
+            for heads, links, route_cost, newcost in runs:
+                missed_improvements += 1
+                # Eventually updates the best
+                if newcost < cost:
+                    best, cost = self._solution(heads, links, route_cost), newcost
+                    missed_improvements = 0
+                # If the maximum number of iterations with no improvement is exceeded
+                # returns the current best
+                if missed_improvements > maxnoimp:
+                    break
         # Return the best solution found at the end of the process
         return best, cost
 
@@ -326,8 +613,7 @@ class ClarkeWrightSavings (object):
         :param config: The configuration of parameters used for the
                         execution of the algorithm (see CWSConfiguration class).
         """
-        best, cost = self.heuristic(config)
-        if config.metaheuristic:
-            starting_sol = config.start or self.heuristic(config)
-            best, cost = self._metaheuristic(starting_sol, config)
-        return best, cost
+        if not config.metaheuristic:
+            return self.heuristic(config)
+        starting_sol = config.start or self.heuristic(config)
+        return self._metaheuristic(starting_sol, config)
@@ -1,7 +1,7 @@
-import abc
+import copy
 
 
-class Edge (abc.ABC):
+class Edge (object):
     """
     The class that inherits from this one
     inherits all the attributes and methods
@@ -10,6 +10,8 @@ class Edge (abc.ABC):
     is going to be computed.
 
     """
+    __slots__ = ("origin", "dest", "saving", "cost", "_inverse")
+
     def __init__(self, origin, dest, saving, cost = 0):
         """
         Initialise.
@@ -25,7 +27,35 @@ class Edge (abc.ABC):
         self.dest = dest
         self.saving = saving
         self.cost = cost
-        self.inverse = None
+        self._inverse = None
+
+    @property
+    def inverse (self):
+        """
+        The inverse edge, going from the destination to the origin.
+
+        If it has never been assigned, the edge is considered symmetric:
+        its inverse is created the first time it is required as a copy
+        of this edge with origin and destination swapped (i.e., with the
+        same saving and cost), and it is then kept.
+        """
+        if self._inverse is None:
+            inverse = copy.copy(self)
+            inverse.origin, inverse.dest = self.dest, self.origin
+            inverse._inverse, self._inverse = self, inverse
+        return self._inverse
+
+    @inverse.setter
+    def inverse (self, edge):
+        self._inverse = edge
+
+    @property
+    def has_inverse (self):
+        """
+        True if the inverse edge has been assigned (or already created),
+        False if reading the inverse would create it.
+        """
+        return self._inverse is not None
 
     def __repr__(self):
         return f"({self.origin} -> {self.dest})"
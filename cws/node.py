@@ -1,7 +1,4 @@
-import abc
-
-
-class Node (abc.ABC):
+class Node (object):
     """
     The class that inherits from this one
     inherits all the attributes and methods
@@ -9,6 +6,8 @@ class Node (abc.ABC):
     on which the Clarke Wright Savings heuristic
     is going to be computed.
     """
+    __slots__ = ("id", "dn_edge", "nd_edge", "route")
+
     def __init__(self, id, dn_edge, nd_edge):
         """
         Initialise.
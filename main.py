@@ -1,25 +1,46 @@
 import cws
 import random
 import math
+import operator
 import itertools
 
 def distance (city1, city2):
-    return int(math.sqrt(math.pow(city1[0] - city2[0], 2) + math.pow(city1[1] - city2[1], 2)))
-
-
-def random_customer (id):
-    return Customer(id, (random.randint(0, 100), random.randint(0, 100)))
-
-
-def get_streets (customers):
-    streets = []
-    for i, j in itertools.combinations(customers, 2):
-        saving = i.nd_edge.cost + j.dn_edge.cost - distance(i.city, j.city)
-        cost = distance(i.city, j.city)
-        s = Street(i, j, saving, cost)
-        s_inverse = Street(j, i, saving, cost)
-        s.inverse, s_inverse.inverse = s_inverse, s
-        streets.append(s)
+    dx, dy = city1[0] - city2[0], city1[1] - city2[1]
+    return math.isqrt(dx * dx + dy * dy)
+
+
+def random_customers (n, rng=random):
+    # All the coordinates are drawn with a single call, and a seeded
+    # random.Random can be passed as rng to get reproducible instances
+    coords = iter(rng.choices(range(101), k=2 * n))
+    return tuple(Customer(i, city) for i, city in enumerate(zip(coords, coords)))
+
+
+def get_streets (customers, shape=1):
+    # Parametric savings s(i, j) = c(i, 0) + c(0, j) - shape * c(i, j),
+    # where shape = 1 gives the classic ones.
+    # Parallel lists with the data of the customers, indexed by position
+    cities = [c.city for c in customers]
+    nd = [c.nd_edge.cost for c in customers]
+    dn = [c.dn_edge.cost for c in customers]
+    n = len(customers)
+    # Distances of all the pairs in condensed form, i.e. the rows of the
+    # upper triangle of the distance matrix one after the other
+    condensed = list(itertools.starmap(distance, itertools.combinations(cities, 2)))
+    streets, k = [None] * len(condensed), 0
+    for i, (ci, ind) in enumerate(zip(customers, nd)):
+        # Costs and savings of the whole row are computed first, so that
+        # the arithmetic runs in tight comprehensions
+        costs = condensed[k:k + n - i - 1]
+        savings = [ind + jdn - shape * cost for jdn, cost in zip(dn[i + 1:], costs)]
+        for cj, saving, cost in zip(customers[i + 1:], savings, costs):
+            # Streets are symmetric, so their inverse is left to
+            # cws.Edge, which creates it only if needed
+            streets[k] = Street(ci, cj, saving, cost)
+            k += 1
+    # Streets are returned already in the order of the savings list, so
+    # that sorting it again in the algorithm takes linear time
+    streets.sort(key=operator.attrgetter("saving"), reverse=True)
     return tuple(streets)
 
 
@@ -27,25 +48,28 @@ depot = (0, 0)
 
 
 class Street (cws.Edge):
-    pass
+    __slots__ = ()
 
 
 class Customer (cws.Node):
+    __slots__ = ("city",)
+
     def __init__(self, id, city):
         self.city = city
-        dn_edge = Street("depot", self, 0, cost=distance(depot, city))
-        nd_edge = Street(self, "depot", 0, cost=distance(city, depot))
+        # The distance is symmetric, so it is the same in both directions
+        d = distance(depot, city)
+        dn_edge = Street("depot", self, 0, cost=d)
+        nd_edge = Street(self, "depot", 0, cost=d)
         dn_edge.inverse = nd_edge
         nd_edge.inverse = dn_edge
         super(Customer, self).__init__(id, dn_edge, nd_edge)
 
 
-customers = tuple(random_customer(i) for i in range(20))
-streets = get_streets(customers)
-
-
 
 if  __name__ == "__main__":
+    customers = random_customers(20)
+    streets = get_streets(customers)
+
     print("Program...", end="")
     config = cws.CWSConfiguration(
         biased = True,
@@ -0,0 +1,240 @@
+import dataclasses
+import random
+import unittest
+
+import cws
+import main
+
+
+
+def make_instance (coords, rng=None):
+    """
+    This method builds the nodes and edges of a small instance where the
+    cost of an edge is the euclidean distance between its extremes.
+    If a random generator is given, each edge gets an explicit inverse
+    with a different cost, so that the instance is asymmetric.
+    """
+    nodes = []
+    for i, point in enumerate(coords):
+        node = cws.Node(i, None, None)
+        d0 = abs(complex(*point))
+        node.dn_edge, node.nd_edge = cws.Edge("depot", node, 0, d0), cws.Edge(node, "depot", 0, d0)
+        node.dn_edge.inverse, node.nd_edge.inverse = node.nd_edge, node.dn_edge
+        nodes.append(node)
+    edges = []
+    for a, i in enumerate(nodes):
+        for j in nodes[a + 1:]:
+            d = abs(complex(*coords[i.id]) - complex(*coords[j.id]))
+            edge = cws.Edge(i, j, i.nd_edge.cost + j.dn_edge.cost - d, d)
+            if rng is not None:
+                rd = d * rng.uniform(1.0, 1.5)
+                edge.inverse = cws.Edge(j, i, j.nd_edge.cost + i.dn_edge.cost - rd, rd)
+                edge.inverse.inverse = edge
+            edges.append(edge)
+    return nodes, edges
+
+
+
+class TestClarkeWrightSavings (unittest.TestCase):
+
+    def assertConsistent (self, nodes, routes, cost):
+        """
+        Check that each node is visited by exactly one route, that each
+        route is a chain of edges from the depot to the depot, and that
+        the costs and the references of the nodes to their route are
+        up to date.
+        """
+        visited = []
+        for route in routes:
+            edges = list(route.edges)
+            self.assertEqual(edges[0].origin, "depot")
+            self.assertEqual(edges[-1].dest, "depot")
+            for edge, following in zip(edges, edges[1:]):
+                self.assertIs(edge.dest, following.origin)
+            for edge in edges[:-1]:
+                self.assertIs(edge.dest.route, route)
+                visited.append(edge.dest)
+            self.assertAlmostEqual(route.cost, sum(edge.cost for edge in edges))
+        self.assertCountEqual(visited, nodes)
+        self.assertAlmostEqual(cost, sum(route.cost for route in routes))
+
+    def test_both_routes_reversed (self):
+        # The routes 0 -> 1 and 2 -> 3 are built first, then the edge 0 -> 3
+        # can only be used by reversing both of them, i.e., by appending the
+        # route 0 -> 1 to the route 2 -> 3 through the inverse edge 3 -> 0.
+        nodes = [cws.Node(i, None, None) for i in range(4)]
+        for node in nodes:
+            node.dn_edge, node.nd_edge = cws.Edge("depot", node, 0, 10), cws.Edge(node, "depot", 0, 10)
+            node.dn_edge.inverse, node.nd_edge.inverse = node.nd_edge, node.dn_edge
+        edge = cws.Edge(nodes[0], nodes[3], 13, 7)
+        edge.inverse = cws.Edge(nodes[3], nodes[0], 12, 8)
+        edges = [cws.Edge(nodes[0], nodes[1], 15, 5), cws.Edge(nodes[2], nodes[3], 14, 6), edge]
+        solver = cws.ClarkeWrightSavings(nodes, edges)
+
+        routes, cost = solver.heuristic(cws.CWSConfiguration(biased=False, reverse=True))
+        self.assertEqual(len(routes), 1)
+        self.assertEqual([e.dest for e in list(routes[0].edges)[:-1]], [nodes[2], nodes[3], nodes[0], nodes[1]])
+        self.assertIs(routes[0].edges[2], edge.inverse)
+        self.assertEqual(cost, 39)
+        self.assertConsistent(nodes, routes, cost)
+
+        routes, cost = solver.heuristic(cws.CWSConfiguration(biased=False, reverse=False))
+        self.assertEqual(len(routes), 2)
+        self.assertConsistent(nodes, routes, cost)
+
+    def test_consistent_solutions (self):
+        rng = random.Random(0)
+        for asymmetric in (False, True):
+            for reverse in (False, True):
+                for maxcost in (float("inf"), 150):
+                    for minroutes in (float("-inf"), 4):
+                        coords = [(rng.randint(-50, 50), rng.randint(-50, 50)) for _ in range(15)]
+                        nodes, edges = make_instance(coords, rng if asymmetric else None)
+                        solver = cws.ClarkeWrightSavings(nodes, edges)
+                        config = cws.CWSConfiguration(biased=False, reverse=reverse,
+                                                    maxcost=maxcost, minroutes=minroutes)
+                        routes, cost = solver.heuristic(config)
+                        self.assertConsistent(nodes, routes, cost)
+                        self.assertGreaterEqual(len(routes), min(minroutes, len(nodes)))
+                        for route in routes:
+                            if len(route.edges) > 2:
+                                self.assertLessEqual(route.cost, maxcost)
+
+    def test_maxcost_with_parametric_savings (self):
+        # With shape != 1 the saving of an edge is not the cost removed by
+        # the merge, so maxcost must be checked on the actual route cost.
+        rng = random.Random(1)
+        config = cws.CWSConfiguration(biased=False, maxcost=250)
+        for shape in (0.3, 1.7):
+            for _ in range(10):
+                customers = main.random_customers(30, rng)
+                streets = main.get_streets(customers, shape)
+                routes, cost = cws.ClarkeWrightSavings(customers, streets).heuristic(config)
+                self.assertConsistent(customers, routes, cost)
+                for route in routes:
+                    if len(route.edges) > 2:
+                        self.assertLessEqual(route.cost, 250)
+
+    def test_edges_not_inheriting_from_edge (self):
+        class Street:
+            def __init__ (self, origin, dest, saving, cost):
+                self.origin, self.dest, self.saving, self.cost = origin, dest, saving, cost
+                self.inverse = None
+
+        nodes, edges = make_instance([(10, 0), (10, 5), (0, 10), (-5, 10)])
+        config = cws.CWSConfiguration(biased=False)
+        # Reading the inverses of symmetric edges does not create them
+        expected = cws.ClarkeWrightSavings(nodes, edges)
+        self.assertFalse(any(edge.has_inverse for edge in edges))
+        _, expected_cost = expected.heuristic(config)
+
+        streets = []
+        for edge in edges:
+            street = Street(edge.origin, edge.dest, edge.saving, edge.cost)
+            street.inverse = Street(edge.dest, edge.origin, edge.saving, edge.cost)
+            street.inverse.inverse = street
+            streets.append(street)
+        routes, cost = cws.ClarkeWrightSavings(nodes, streets).heuristic(config)
+        self.assertConsistent(nodes, routes, cost)
+        self.assertAlmostEqual(cost, expected_cost)
+
+        # Without reversions the inverse edges are not needed at all
+        config = cws.CWSConfiguration(biased=False, reverse=False)
+        _, expected_cost = expected.heuristic(config)
+        for street in streets:
+            street.inverse = None
+        routes, cost = cws.ClarkeWrightSavings(nodes, streets).heuristic(config)
+        self.assertConsistent(nodes, routes, cost)
+        self.assertAlmostEqual(cost, expected_cost)
+
+    def test_metaheuristic (self):
+        rng = random.Random(2)
+        coords = [(rng.randint(0, 100), rng.randint(0, 100)) for _ in range(30)]
+        solver = cws.ClarkeWrightSavings.build_from_coords(coords)
+        for workers in (1, 2):
+            start = solver.heuristic(cws.CWSConfiguration(biased=False, maxcost=300))
+            config = cws.CWSConfiguration(biased=True, metaheuristic=True, start=start, maxiter=30,
+                                        maxnoimp=30, maxcost=300, workers=workers)
+            # All the iterations are made, also when they are split in batches
+            self.assertEqual(len(list(solver._kernel_runs(solver._savings_order(), config))), 30)
+            routes, cost = solver(config)
+            self.assertConsistent(solver.nodes, routes, cost)
+            self.assertLessEqual(cost, start[1])
+            for route in routes:
+                self.assertLessEqual(route.cost, 300)
+
+    def test_metaheuristic_maxnoimp (self):
+        solver = cws.ClarkeWrightSavings.build_from_coords([(3, 4), (6, 8), (-5, 12), (0, -7)])
+        runs = []
+
+        def greedy (array):
+            runs.append(None)
+            return array
+
+        start = solver.heuristic(cws.CWSConfiguration(biased=False))
+        config = cws.CWSConfiguration(biasedfunc=greedy, metaheuristic=True, start=start, maxnoimp=0)
+        routes, cost = solver(config)
+        # The first run does not improve the starting solution, so it is the last one
+        self.assertEqual(len(runs), 1)
+        self.assertIs(routes, start[0])
+        self.assertEqual(cost, start[1])
+        self.assertConsistent(solver.nodes, routes, cost)
+
+    def test_build_from_coords (self):
+        coords = [(3, 4), (6, 8), (-5, 12), (0, -7), (9, -2)]
+        solver = cws.ClarkeWrightSavings.build_from_coords(coords, depot=(1, 1))
+        nodes, edges = solver.nodes, solver.edges
+        self.assertEqual([node.id for node in nodes], list(range(len(coords))))
+        self.assertEqual(len(edges), len(coords) * (len(coords) - 1) // 2)
+        self.assertEqual({(e.origin.id, e.dest.id) for e in edges},
+                        {(i, j) for i in range(len(coords)) for j in range(i + 1, len(coords))})
+        for node in nodes:
+            d0 = abs(complex(*coords[node.id]) - complex(1, 1))
+            self.assertAlmostEqual(node.dn_edge.cost, d0)
+            self.assertIs(node.nd_edge.inverse, node.dn_edge)
+        for edge in edges:
+            i, j = edge.origin.id, edge.dest.id
+            dij = abs(complex(*coords[i]) - complex(*coords[j]))
+            self.assertAlmostEqual(edge.cost, dij)
+            self.assertAlmostEqual(edge.saving, nodes[i].nd_edge.cost + nodes[j].dn_edge.cost - dij)
+            # Edges are symmetric
+            self.assertEqual((edge.inverse.saving, edge.inverse.cost), (edge.saving, edge.cost))
+        routes, cost = solver.heuristic(cws.CWSConfiguration(biased=False, maxcost=40))
+        self.assertConsistent(nodes, routes, cost)
+
+        self.assertEqual(cws.ClarkeWrightSavings.build_from_coords([]).heuristic(cws.CWSConfiguration()), ([], 0))
+        solver = cws.ClarkeWrightSavings.build_from_coords([(3, 4)])
+        self.assertEqual(solver.edges, [])
+        routes, cost = solver.heuristic(cws.CWSConfiguration())
+        self.assertConsistent(solver.nodes, routes, cost)
+        self.assertEqual(cost, 10)
+
+    def test_neighbours (self):
+        rng = random.Random(0)
+        coords = [(rng.randint(0, 100), rng.randint(0, 100)) for _ in range(150)]
+        solver = cws.ClarkeWrightSavings.build_from_coords(coords)
+        config = cws.CWSConfiguration(biased=False, maxcost=400)
+        routes, cost = solver.heuristic(config)
+        # Keeping all the neighbours of each node prunes nothing
+        full, full_cost = solver.heuristic(dataclasses.replace(config, neighbours=len(coords) - 1))
+        self.assertEqual(full_cost, cost)
+        self.assertEqual([[e.dest for e in r.edges] for r in full], [[e.dest for e in r.edges] for r in routes])
+        # The nearest neighbours are enough for a solution close to the best
+        pruned, pruned_cost = solver.heuristic(dataclasses.replace(config, neighbours=20))
+        self.assertConsistent(solver.nodes, pruned, pruned_cost)
+        self.assertLessEqual(pruned_cost, 1.05 * cost)
+
+    def test_invalid_neighbours (self):
+        for neighbours in (0, -1):
+            with self.assertRaises(ValueError):
+                cws.CWSConfiguration(neighbours=neighbours)
+
+    def test_invalid_workers (self):
+        for workers in (0, -1):
+            with self.assertRaises(ValueError):
+                cws.CWSConfiguration(workers=workers)
+
+
+
+if __name__ == "__main__":
+    unittest.main()